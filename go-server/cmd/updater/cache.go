@@ -0,0 +1,129 @@
+package main
+
+import (
+	"encoding/json"
+	"net/http"
+	"os"
+	"path/filepath"
+	"strings"
+	"time"
+)
+
+// cacheTTL is how long a cached provider listing is used without refetching.
+const cacheTTL = 24 * time.Hour
+
+// maxStaleAge is the oldest cached listing that may stand in for a failed
+// fetch. Anything older is too likely to hide real upstream changes.
+const maxStaleAge = 7 * 24 * time.Hour
+
+// cacheEntry is a provider's model listing together with the HTTP validators
+// of the response it came from. It is both the on-disk cache format and the
+// result of a fetch, so a later run can revalidate the same URL with a
+// conditional GET instead of downloading it again.
+type cacheEntry struct {
+	Models       []string `json:"models"`
+	URL          string   `json:"url,omitempty"`
+	ETag         string   `json:"etag,omitempty"`
+	LastModified string   `json:"last_modified,omitempty"`
+	NotModified  bool     `json:"-"` // server answered 304; Models came from the previous entry
+}
+
+// setConditionalHeaders adds If-None-Match / If-Modified-Since to req when
+// prev was fetched from the same url and carries validators.
+func setConditionalHeaders(req *http.Request, url string, prev *cacheEntry) {
+	if prev == nil || prev.URL != url || len(prev.Models) == 0 {
+		return
+	}
+	if prev.ETag != "" {
+		req.Header.Set("If-None-Match", prev.ETag)
+	}
+	if prev.LastModified != "" {
+		req.Header.Set("If-Modified-Since", prev.LastModified)
+	}
+}
+
+// isNotModified reports whether resp is a 304 for a request that was
+// revalidating prev, meaning prev's listing is still current.
+func isNotModified(resp *http.Response, url string, prev *cacheEntry) bool {
+	return resp.StatusCode == http.StatusNotModified && prev != nil && prev.URL == url && len(prev.Models) > 0
+}
+
+// unchanged returns a copy of e marked as revalidated by a 304 response.
+func (e cacheEntry) unchanged() cacheEntry {
+	e.NotModified = true
+	return e
+}
+
+// newCacheEntry records the models fetched from url along with resp's validators.
+func newCacheEntry(resp *http.Response, url string, ids []string) cacheEntry {
+	return cacheEntry{
+		Models:       ids,
+		URL:          url,
+		ETag:         resp.Header.Get("ETag"),
+		LastModified: resp.Header.Get("Last-Modified"),
+	}
+}
+
+// modelCache stores each provider's raw model listing as a JSON file under
+// dir. Fresh entries let repeat runs skip the network entirely, and stale
+// entries are kept as a fallback when a provider cannot be reached.
+// A nil *modelCache disables caching: reads miss and writes are no-ops.
+type modelCache struct {
+	dir string
+}
+
+// newModelCache returns a cache rooted in the user cache directory
+// (e.g. ~/.cache/model-registry), or nil if that directory is unavailable.
+func newModelCache() *modelCache {
+	base, err := os.UserCacheDir()
+	if err != nil {
+		return nil
+	}
+	return &modelCache{dir: filepath.Join(base, "model-registry")}
+}
+
+func (c *modelCache) path(provider string) string {
+	return filepath.Join(c.dir, strings.ToLower(provider)+".json")
+}
+
+// read returns the cached entry for provider and how long ago it was
+// written. ok is false if nothing usable is cached.
+func (c *modelCache) read(provider string) (entry cacheEntry, age time.Duration, ok bool) {
+	if c == nil {
+		return cacheEntry{}, 0, false
+	}
+	p := c.path(provider)
+	info, err := os.Stat(p)
+	if err != nil {
+		return cacheEntry{}, 0, false
+	}
+	data, err := os.ReadFile(p)
+	if err != nil {
+		return cacheEntry{}, 0, false
+	}
+	if err := json.Unmarshal(data, &entry); err != nil || len(entry.Models) == 0 {
+		return cacheEntry{}, 0, false
+	}
+	return entry, time.Since(info.ModTime()), true
+}
+
+// write stores entry as the latest listing for provider. The file is written
+// to a temporary name and renamed so a crash never leaves a partial entry.
+func (c *modelCache) write(provider string, entry cacheEntry) error {
+	if c == nil {
+		return nil
+	}
+	if err := os.MkdirAll(c.dir, 0o755); err != nil {
+		return err
+	}
+	data, err := json.Marshal(entry)
+	if err != nil {
+		return err
+	}
+	p := c.path(provider)
+	tmp := p + ".tmp"
+	if err := os.WriteFile(tmp, data, 0o644); err != nil {
+		return err
+	}
+	return os.Rename(tmp, p)
+}
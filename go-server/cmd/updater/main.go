@@ -7,13 +7,17 @@ import (
 	_ "embed"
 	"encoding/hex"
 	"encoding/json"
+	"flag"
 	"fmt"
 	"io"
+	"math/rand"
 	"net/http"
 	"os"
 	"regexp"
 	"sort"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"go-server/internal/models"
@@ -69,50 +73,88 @@ func normalizeMistralID(id string) string {
 var normalizationJSON []byte
 
 type NormalizationRules struct {
+	IgnoreIDs      []string          `json:"ignore_ids"`
 	IgnorePatterns []string          `json:"ignore_patterns"`
 	Aliases        map[string]string `json:"aliases"`
 }
 type NormalizationConfig map[string]NormalizationRules
 
-var normConfig NormalizationConfig
-var normIgnoreCompiled map[string][]*regexp.Regexp
+// normalization is the parsed and compiled form of normalization.json.
+type normalization struct {
+	config NormalizationConfig
 
-func init() {
-	if err := json.Unmarshal(normalizationJSON, &normConfig); err != nil {
+	// ignoreRe holds one combined regex per provider. All of a provider's
+	// ignore_patterns are joined into a single alternation so each ID is
+	// tested with one regex scan instead of one scan per pattern.
+	ignoreRe map[string]*regexp.Regexp
+
+	// ignoreIDs holds each provider's ignore_ids as a set. Exact IDs are
+	// checked with a map lookup before falling back to the pattern regex.
+	ignoreIDs map[string]map[string]bool
+}
+
+// loadNormalization parses normalization.json and compiles its patterns on
+// first use rather than at package init, so runs that exit during flag
+// parsing (e.g. -h) skip the work. It is safe for concurrent provider checks.
+var loadNormalization = sync.OnceValue(func() *normalization {
+	n := &normalization{
+		ignoreRe:  make(map[string]*regexp.Regexp),
+		ignoreIDs: make(map[string]map[string]bool),
+	}
+	if err := json.Unmarshal(normalizationJSON, &n.config); err != nil {
 		fmt.Fprintf(os.Stderr, "WARNING: failed to parse normalization.json: %v\n", err)
-		normConfig = NormalizationConfig{}
+		n.config = NormalizationConfig{}
 	}
-	normIgnoreCompiled = make(map[string][]*regexp.Regexp)
-	for provider, rules := range normConfig {
-		for _, pat := range rules.IgnorePatterns {
-			if re, err := regexp.Compile(pat); err == nil {
-				normIgnoreCompiled[provider] = append(normIgnoreCompiled[provider], re)
+	for provider, rules := range n.config {
+		if re := compileAlternation(rules.IgnorePatterns); re != nil {
+			n.ignoreRe[provider] = re
+		}
+		if len(rules.IgnoreIDs) > 0 {
+			ids := make(map[string]bool, len(rules.IgnoreIDs))
+			for _, id := range rules.IgnoreIDs {
+				ids[id] = true
 			}
+			n.ignoreIDs[provider] = ids
 		}
 	}
+	return n
+})
+
+// compileAlternation combines patterns into a single regex matching any of
+// them. Patterns that fail to compile on their own are skipped, matching the
+// previous per-pattern behavior. Returns nil if no pattern is usable.
+func compileAlternation(patterns []string) *regexp.Regexp {
+	var valid []string
+	for _, pat := range patterns {
+		if _, err := regexp.Compile(pat); err == nil {
+			valid = append(valid, "(?:"+pat+")")
+		}
+	}
+	if len(valid) == 0 {
+		return nil
+	}
+	return regexp.MustCompile(strings.Join(valid, "|"))
 }
 
 func applyNormalization(provider string, ids []string) []string {
 	provider = strings.ToLower(provider)
-	ignores := normIgnoreCompiled[provider]
-	rules, hasRules := normConfig[provider]
+	norm := loadNormalization()
+	ignoreRe := norm.ignoreRe[provider]
+	ignoreIDs := norm.ignoreIDs[provider]
+	rules, hasRules := norm.config[provider]
 
-	if !hasRules && len(ignores) == 0 {
+	if !hasRules && ignoreRe == nil && ignoreIDs == nil {
 		return ids
 	}
 
 	seen := make(map[string]bool, len(ids))
 	var result []string
 	for _, id := range ids {
-		// Check ignore patterns
-		ignored := false
-		for _, re := range ignores {
-			if re.MatchString(id) {
-				ignored = true
-				break
-			}
+		// Check exact ignore IDs, then ignore patterns
+		if ignoreIDs[id] {
+			continue
 		}
-		if ignored {
+		if ignoreRe != nil && ignoreRe.MatchString(id) {
 			continue
 		}
 
@@ -346,6 +388,38 @@ var knownModels = map[string]map[string]bool{
 	},
 }
 
+// providerOrder lists the providers checked against their docs or API, in
+// report order.
+var providerOrder = []string{"OpenAI", "Anthropic", "Google", "Mistral", "xAI", "DeepSeek", "Zhipu", "MiniMax"}
+
+// manualProviders lists providers without a scrapable model listing, in
+// report order, along with where to check them by hand.
+var manualProviders = []struct {
+	Name   string
+	Reason string
+}{
+	{"Meta", "no scrapable model listing (models are provider-hosted)"},
+	{"Amazon", "no scrapable model listing (check AWS Bedrock console)"},
+	{"Cohere", "no scrapable model listing (check docs.cohere.com)"},
+	{"Perplexity", "no scrapable model listing (check docs.perplexity.ai)"},
+	{"AI21", "no scrapable model listing (check docs.ai21.com)"},
+	{"Moonshot", "no scrapable model listing (check platform.moonshot.cn)"},
+	{"NVIDIA", "no scrapable model listing (check build.nvidia.com)"},
+	{"Tencent", "no scrapable model listing (check cloud.tencent.com/product/hunyuan)"},
+	{"Microsoft", "no scrapable model listing (check ai.azure.com)"},
+	{"Xiaomi", "no scrapable model listing (check platform.xiaomimimo.com)"},
+	{"Kuaishou", "no scrapable model listing (check kwaipilot.com)"},
+}
+
+// manualResults returns a skipped providerResult for each manual provider.
+func manualResults() []providerResult {
+	results := make([]providerResult, len(manualProviders))
+	for i, p := range manualProviders {
+		results[i] = providerResult{Name: p.Name, SkipReason: p.Reason}
+	}
+	return results
+}
+
 var apiEndpoints = map[string]struct {
 	URL    string
 	EnvKey string
@@ -358,158 +432,339 @@ var apiEndpoints = map[string]struct {
 
 const maxRetries = 3
 
+// retryBaseDelay is the backoff before the first retry. It doubles on each
+// later retry, and up to the same amount again is added as random jitter so
+// concurrent provider checks do not retry in lockstep.
+var retryBaseDelay = time.Second
+
+// maxResponseBody caps how much of a response is read (2MB).
+const maxResponseBody = 2 * 1024 * 1024
+
+// maxRetryAfter caps how long a server-supplied Retry-After may delay a retry.
+const maxRetryAfter = 30 * time.Second
+
+// providerTimeout bounds one provider check, including retries and fallback
+// URLs, so a single hung provider cannot stall the whole run.
+const providerTimeout = 3 * time.Minute
+
+// loadAPIKeys snapshots provider API keys from the environment once, keyed
+// by provider name. Providers whose key is unset are omitted.
+func loadAPIKeys() map[string]string {
+	keys := make(map[string]string, len(apiEndpoints))
+	for name, ep := range apiEndpoints {
+		if key := os.Getenv(ep.EnvKey); key != "" {
+			keys[name] = key
+		}
+	}
+	return keys
+}
+
+// githubConfig holds the credentials used to file issues, read once from
+// GITHUB_TOKEN and GITHUB_REPO at startup.
+type githubConfig struct {
+	Token string
+	Repo  string // "owner/repo"
+}
+
+// enabled reports whether both GitHub credentials are set.
+func (g githubConfig) enabled() bool {
+	return g.Token != "" && g.Repo != ""
+}
+
+// userAgent identifies the updater to provider docs and APIs.
+const userAgent = "ModelRegistryUpdater/1.0"
+
+// newHTTPClient returns the single client shared by every provider check.
+// The transport negotiates HTTP/2 and keeps several idle connections per
+// host, so fallback URLs and retries against the same host reuse an open
+// TLS connection instead of paying for a fresh DNS lookup and handshake.
+func newHTTPClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.ForceAttemptHTTP2 = true
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 20
+	transport.IdleConnTimeout = 90 * time.Second
+	return &http.Client{Timeout: 30 * time.Second, Transport: transport}
+}
+
 func main() {
-	client := &http.Client{Timeout: 30 * time.Second}
+	useCache := flag.Bool("cache", false, "reuse provider listings cached on disk by earlier local runs")
+	flag.Parse()
+
+	// The cache is opt-in: scheduled runs happen once per cacheTTL, so a
+	// cached listing would otherwise hide every other day's upstream changes.
+	var cache *modelCache
+	if *useCache {
+		cache = newModelCache()
+	}
+	client := newHTTPClient()
 	ctx := context.Background()
+	apiKeys := loadAPIKeys()
+	gh := githubConfig{Token: os.Getenv("GITHUB_TOKEN"), Repo: os.Getenv("GITHUB_REPO")}
 
 	hasChanges := false
 	hasErrors := false
-	providerOrder := []string{"OpenAI", "Anthropic", "Google", "Mistral", "xAI", "DeepSeek", "Zhipu", "MiniMax"}
 
-	// Capture report output for GitHub issue creation.
+	// The report is built in memory and written to stdout in one call once
+	// it is complete; the same text is attached to any GitHub issue.
 	var report strings.Builder
 	var allMissing []string
 	var allNew []string
 
 	logf := func(format string, args ...any) {
-		line := fmt.Sprintf(format, args...)
-		fmt.Print(line)
-		report.WriteString(line)
+		fmt.Fprintf(&report, format, args...)
 	}
 
 	logf("=== Model Registry Update Check ===\n")
 	logf("Time: %s\n\n", time.Now().UTC().Format(time.RFC3339))
 
-	for _, name := range providerOrder {
-		src, ok := docSources[name]
-		if !ok {
-			logf("[%s] SKIP: no doc source configured\n", name)
+	// Manual providers have nothing to fetch, so their results are built
+	// directly instead of being scheduled alongside the real checks.
+	results := append(checkProviders(ctx, client, cache, apiKeys, providerOrder, providerTimeout), manualResults()...)
+	for _, res := range results {
+		if res.SkipReason != "" {
+			logf("[%s] SKIP: %s\n", res.Name, res.SkipReason)
 			continue
 		}
-
-		var ids []string
-		var err error
-
-		// Try API first if endpoint and key are configured
-		if ep, ok := apiEndpoints[name]; ok {
-			if key := os.Getenv(ep.EnvKey); key != "" {
-				ids, err = fetchModelsFromAPI(ctx, client, ep.URL, key)
-				if err == nil && len(ids) > 0 {
-					logf("[%s] Fetched %d models via API\n", name, len(ids))
-				} else {
-					if err != nil {
-						logf("[%s] API fetch failed (%v), falling back to docs scraping\n", name, err)
-					}
-					ids = nil
-					err = nil
-				}
-			}
-		}
-
-		// Fall back to HTML scraping
-		if len(ids) == 0 {
-			ids, err = fetchModelsFromDocs(ctx, client, src)
-			if err != nil {
-				logf("[%s] ERROR: %v\n", name, err)
-				hasErrors = true
-				continue
-			}
+		for _, note := range res.Notes {
+			logf("%s", note)
 		}
-
-		ids = applyNormalization(name, ids)
-
-		known := knownModels[name]
-
-		// Circuit breaker: if scraper returns 0 models but we track >0,
-		// the scraper likely failed silently (anti-bot, page restructure).
-		if len(ids) == 0 && len(known) > 0 {
-			logf("[%s] CIRCUIT BREAKER: scraper returned 0 models but we track %d. Skipping diff.\n", name, len(known))
+		if res.Err != nil {
+			logf("[%s] ERROR: %v\n", res.Name, res.Err)
+			hasErrors = true
 			continue
 		}
-
-		// Sanity check: warn if scraped count is suspiciously low.
-		if len(ids) > 0 && len(ids)*5 < len(known) {
-			logf("[%s] WARNING: scraped only %d models vs %d tracked. Results may be incomplete.\n", name, len(ids), len(known))
+		if res.Stale {
+			hasErrors = true
 		}
+		if res.Tripped {
+			continue
+		}
+		logf("[%s] Docs returned %d model IDs, we track %d\n", res.Name, len(res.IDs), res.Known)
 
-		newModels, missing := diff(known, ids)
-
-		logf("[%s] Docs returned %d model IDs, we track %d\n", name, len(ids), len(known))
-
-		if len(newModels) > 0 {
+		if len(res.New) > 0 {
 			hasChanges = true
-			sort.Strings(newModels)
-			allNew = append(allNew, newModels...)
-			logf("  NEW (%d):\n", len(newModels))
-			for _, m := range newModels {
-				logf("    + %s\n", m)
-			}
+			allNew = append(allNew, res.New...)
+			logf("  NEW (%d):\n", len(res.New))
+			writeIDList(&report, "+", res.New)
 		}
-		if len(missing) > 0 {
+		if len(res.Missing) > 0 {
 			hasChanges = true
-			sort.Strings(missing)
-			allMissing = append(allMissing, missing...)
-			logf("  MISSING from docs (%d):\n", len(missing))
-			for _, m := range missing {
-				logf("    - %s\n", m)
-			}
+			allMissing = append(allMissing, res.Missing...)
+			logf("  MISSING from docs (%d):\n", len(res.Missing))
+			writeIDList(&report, "-", res.Missing)
 		}
-		if len(newModels) == 0 && len(missing) == 0 {
+		if len(res.New) == 0 && len(res.Missing) == 0 {
 			logf("  OK: in sync\n")
 		}
 		logf("\n")
 	}
 
-	// Providers without scrapable documentation — just note them.
-	logf("[Meta] SKIP: no scrapable model listing (models are provider-hosted)\n")
-	logf("[Amazon] SKIP: no scrapable model listing (check AWS Bedrock console)\n")
-	logf("[Cohere] SKIP: no scrapable model listing (check docs.cohere.com)\n")
-	logf("[Perplexity] SKIP: no scrapable model listing (check docs.perplexity.ai)\n")
-	logf("[AI21] SKIP: no scrapable model listing (check docs.ai21.com)\n")
-	logf("[Moonshot] SKIP: no scrapable model listing (check platform.moonshot.cn)\n")
-	logf("[NVIDIA] SKIP: no scrapable model listing (check build.nvidia.com)\n")
-	logf("[Tencent] SKIP: no scrapable model listing (check cloud.tencent.com/product/hunyuan)\n")
-	logf("[Microsoft] SKIP: no scrapable model listing (check ai.azure.com)\n")
-	logf("[Xiaomi] SKIP: no scrapable model listing (check platform.xiaomimimo.com)\n")
-	logf("[Kuaishou] SKIP: no scrapable model listing (check kwaipilot.com)\n")
-
 	logf("\n=== Summary ===\n")
+	exitCode := 0
 	if hasChanges {
 		if hasErrors {
 			logf("WARNING: Some providers failed to respond (see errors above).\n")
 		}
 		logf("Changes detected. Review the output above.\n")
+		exitCode = 1
+	} else if hasErrors {
+		logf("No model changes detected, but some providers could not be checked.\n")
+		exitCode = 1
+	} else {
+		logf("All tracked providers are in sync.\n")
+	}
+	_, _ = io.WriteString(os.Stdout, report.String())
+
+	if hasChanges && gh.enabled() {
 		if len(allMissing) > 0 {
-			createDeprecationIssue(ctx, client, allMissing, report.String())
+			createDeprecationIssue(ctx, client, gh, allMissing, report.String())
 		}
 		if len(allNew) > 0 {
-			createNewModelsIssue(ctx, client, allNew, report.String())
+			createNewModelsIssue(ctx, client, gh, allNew, report.String())
 		}
-		os.Exit(1)
-	} else if hasErrors {
-		logf("No model changes detected, but some providers could not be checked.\n")
-		os.Exit(1)
 	}
-	logf("All tracked providers are in sync.\n")
-	os.Exit(0)
+	os.Exit(exitCode)
 }
 
-func fetchModelsFromAPI(ctx context.Context, client *http.Client, endpoint, apiKey string) ([]string, error) {
-	req, err := http.NewRequestWithContext(ctx, http.MethodGet, endpoint, nil)
-	if err != nil {
-		return nil, err
+// maxReportItems caps how many IDs are listed in each NEW or MISSING section
+// of the report. The GitHub issues still list every ID.
+const maxReportItems = 50
+
+// writeIDList writes up to maxReportItems IDs to b, one per line prefixed by
+// marker, followed by a count of any IDs that were left out.
+func writeIDList(b *strings.Builder, marker string, ids []string) {
+	shown := ids
+	if len(shown) > maxReportItems {
+		shown = shown[:maxReportItems]
 	}
-	req.Header.Set("Authorization", "Bearer "+apiKey)
-	req.Header.Set("Accept", "application/json")
+	for _, id := range shown {
+		fmt.Fprintf(b, "    %s %s\n", marker, id)
+	}
+	if rest := len(ids) - len(shown); rest > 0 {
+		fmt.Fprintf(b, "    ... and %d more\n", rest)
+	}
+}
 
-	resp, err := client.Do(req)
+// providerResult is the outcome of checking one provider against the registry.
+type providerResult struct {
+	Name       string
+	Notes      []string // log lines produced while checking, printed before the diff
+	IDs        []string // normalized model IDs returned by the API or docs
+	Known      int      // number of model IDs tracked in knownModels
+	New        []string // sorted IDs found upstream but not tracked
+	Missing    []string // sorted IDs tracked but not found upstream
+	Err        error
+	SkipReason string // set when the provider was not checked at all
+	Tripped    bool   // circuit breaker fired; no diff was computed
+	Stale      bool   // fetch failed; the diff used an older cached listing
+}
+
+// checkProviders checks every named provider concurrently, each under its
+// own timeout, and returns the results in the same order as names. Providers
+// without a doc source are returned as skipped. A panic inside one check is
+// recovered and reported as that provider's error so the others still finish.
+func checkProviders(ctx context.Context, client *http.Client, cache *modelCache, apiKeys map[string]string, names []string, timeout time.Duration) []providerResult {
+	results := make([]providerResult, len(names))
+	var wg sync.WaitGroup
+	for i, name := range names {
+		src, ok := docSources[name]
+		if !ok {
+			results[i] = providerResult{Name: name, SkipReason: "no doc source configured"}
+			continue
+		}
+		wg.Add(1)
+		go func(i int, name string, src DocSource) {
+			defer wg.Done()
+			defer func() {
+				if r := recover(); r != nil {
+					results[i] = providerResult{Name: name, Err: fmt.Errorf("panic during check: %v", r)}
+				}
+			}()
+			pctx, cancel := context.WithTimeout(ctx, timeout)
+			defer cancel()
+			results[i] = checkProvider(pctx, client, cache, name, src, apiKeys[name])
+		}(i, name, src)
+	}
+	wg.Wait()
+	return results
+}
+
+// checkProvider fetches a provider's model IDs (API first when a key is
+// configured, docs scraping otherwise), normalizes them, and diffs them
+// against knownModels. Every provider goes through this one path so that
+// fetching, fallback, and sanity checks live in a single place.
+//
+// A listing cached less than cacheTTL ago is used without touching the
+// network. An older listing is revalidated with a conditional GET. If the
+// fetch fails, a listing younger than maxStaleAge is still diffed but the
+// result is marked Stale so the run does not report the provider as in sync.
+func checkProvider(ctx context.Context, client *http.Client, cache *modelCache, name string, src DocSource, apiKey string) providerResult {
+	res := providerResult{Name: name}
+	notef := func(format string, args ...any) {
+		res.Notes = append(res.Notes, fmt.Sprintf(format, args...))
+	}
+
+	var ids []string
+	cached, age, hasCache := cache.read(name)
+	if hasCache && age < cacheTTL {
+		notef("[%s] Using cached listing (%s old)\n", name, age.Round(time.Minute))
+		ids = cached.Models
+	} else {
+		var prev *cacheEntry
+		if hasCache {
+			prev = &cached
+		}
+		entry, err := fetchProviderModels(ctx, client, name, src, apiKey, prev, notef)
+		switch {
+		case err == nil:
+			if entry.NotModified {
+				notef("[%s] Listing unchanged since last fetch (HTTP 304)\n", name)
+			}
+			ids = entry.Models
+			// Rewrite even on 304 so the TTL restarts from this revalidation.
+			if err := cache.write(name, entry); err != nil {
+				notef("[%s] WARNING: failed to update cache: %v\n", name, err)
+			}
+		case hasCache && age < maxStaleAge:
+			notef("[%s] WARNING: %v; using stale cached listing (%s old)\n", name, err, age.Round(time.Minute))
+			ids = cached.Models
+			res.Stale = true
+		default:
+			res.Err = err
+			return res
+		}
+	}
+
+	res.IDs = applyNormalization(name, ids)
+	known := knownModels[name]
+	res.Known = len(known)
+
+	// Circuit breaker: if scraper returns 0 models but we track >0,
+	// the scraper likely failed silently (anti-bot, page restructure).
+	if len(res.IDs) == 0 && len(known) > 0 {
+		notef("[%s] CIRCUIT BREAKER: scraper returned 0 models but we track %d. Skipping diff.\n", name, len(known))
+		res.Tripped = true
+		return res
+	}
+
+	// Sanity check: warn if scraped count is suspiciously low.
+	if len(res.IDs) > 0 && len(res.IDs)*5 < len(known) {
+		notef("[%s] WARNING: scraped only %d models vs %d tracked. Results may be incomplete.\n", name, len(res.IDs), len(known))
+	}
+
+	res.New, res.Missing = diff(known, res.IDs)
+	sort.Strings(res.New)
+	sort.Strings(res.Missing)
+	return res
+}
+
+// fetchProviderModels returns a provider's model listing from its API when an
+// endpoint is configured and apiKey is non-empty, falling back to scraping
+// its public docs.
+// prev, if non-nil, is the previously cached listing used to revalidate the
+// same URL with a conditional GET.
+func fetchProviderModels(ctx context.Context, client *http.Client, name string, src DocSource, apiKey string, prev *cacheEntry, notef func(string, ...any)) (cacheEntry, error) {
+	// Try API first if endpoint and key are configured
+	if ep, ok := apiEndpoints[name]; ok && apiKey != "" {
+		entry, err := fetchModelsFromAPI(ctx, client, ep.URL, apiKey, prev)
+		if err == nil && len(entry.Models) > 0 {
+			notef("[%s] Fetched %d models via API\n", name, len(entry.Models))
+			return entry, nil
+		}
+		if err != nil {
+			notef("[%s] API fetch failed (%v), falling back to docs scraping\n", name, err)
+		}
+	}
+
+	// Fall back to HTML scraping
+	return fetchModelsFromDocs(ctx, client, src, prev)
+}
+
+// fetchModelsFromAPI lists model IDs from an OpenAI-compatible /models
+// endpoint. If prev was fetched from the same endpoint, the request is
+// conditional and a 304 returns prev unchanged without parsing a body.
+func fetchModelsFromAPI(ctx context.Context, client *http.Client, endpoint, apiKey string, prev *cacheEntry) (cacheEntry, error) {
+	resp, body, err := doWithRetry(ctx, client, func() (*http.Request, error) {
+		req, err := http.NewRequestWithContext(ctx, http.MethodGet, endpoint, nil)
+		if err != nil {
+			return nil, err
+		}
+		req.Header.Set("Authorization", "Bearer "+apiKey)
+		req.Header.Set("Accept", "application/json")
+		req.Header.Set("User-Agent", userAgent)
+		setConditionalHeaders(req, endpoint, prev)
+		return req, nil
+	})
 	if err != nil {
-		return nil, fmt.Errorf("API request failed: %w", err)
+		return cacheEntry{}, fmt.Errorf("API request failed: %w", err)
 	}
-	defer resp.Body.Close()
 
+	if isNotModified(resp, endpoint, prev) {
+		return prev.unchanged(), nil
+	}
 	if resp.StatusCode != http.StatusOK {
-		return nil, fmt.Errorf("API returned HTTP %d", resp.StatusCode)
+		return cacheEntry{}, fmt.Errorf("API returned HTTP %d", resp.StatusCode)
 	}
 
 	var result struct {
@@ -517,8 +772,8 @@ func fetchModelsFromAPI(ctx context.Context, client *http.Client, endpoint, apiK
 			ID string `json:"id"`
 		} `json:"data"`
 	}
-	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
-		return nil, fmt.Errorf("failed to parse API response: %w", err)
+	if err := json.Unmarshal(body, &result); err != nil {
+		return cacheEntry{}, fmt.Errorf("failed to parse API response: %w", err)
 	}
 
 	ids := make([]string, 0, len(result.Data))
@@ -527,120 +782,196 @@ func fetchModelsFromAPI(ctx context.Context, client *http.Client, endpoint, apiK
 			ids = append(ids, m.ID)
 		}
 	}
-	return ids, nil
+	return newCacheEntry(resp, endpoint, ids), nil
 }
 
 // fetchModelsFromDocs fetches a public documentation page and extracts model IDs
 // using the provider's regex pattern. No API keys needed.
-func fetchModelsFromDocs(ctx context.Context, client *http.Client, src DocSource) ([]string, error) {
+func fetchModelsFromDocs(ctx context.Context, client *http.Client, src DocSource, prev *cacheEntry) (cacheEntry, error) {
 	var lastErr error
 	for _, url := range src.URLs {
-		ids, err := fetchAndExtract(ctx, client, url, src.Pattern)
+		entry, err := fetchAndExtract(ctx, client, url, src.Pattern, prev)
 		if err != nil {
 			lastErr = err
 			continue
 		}
-		if len(ids) > 0 {
-			if src.ExcludePattern != nil {
-				filtered := make([]string, 0, len(ids))
-				for _, id := range ids {
-					if !src.ExcludePattern.MatchString(id) {
-						filtered = append(filtered, id)
-					}
-				}
-				ids = filtered
-			}
-			if src.NormalizeRe != nil {
-				for i, id := range ids {
-					ids[i] = src.NormalizeRe.ReplaceAllString(id, src.NormalizeRepl)
-				}
-			}
-			if src.NormalizeFunc != nil {
-				for i, id := range ids {
-					ids[i] = src.NormalizeFunc(id)
-				}
-			}
-			if src.Lowercase {
-				for i, id := range ids {
-					ids[i] = strings.ToLower(id)
-				}
-			}
-			// Universal: strip mode suffixes (e.g. -reasoning, -non-reasoning)
-			// so that variants collapse to their base model ID.
-			for i, id := range ids {
-				ids[i] = stripModeSuffixes(id)
-			}
-			seen := make(map[string]bool, len(ids))
-			deduped := make([]string, 0, len(ids))
-			for _, id := range ids {
-				if !seen[id] {
-					seen[id] = true
-					deduped = append(deduped, id)
-				}
-			}
-			ids = deduped
-			if len(ids) > 0 {
-				return ids, nil
-			}
+		// A 304 returns the previous listing, which is already cleaned.
+		if entry.NotModified {
+			return entry, nil
+		}
+		entry.Models = cleanDocIDs(src, entry.Models)
+		if len(entry.Models) > 0 {
+			return entry, nil
 		}
 	}
 	if lastErr != nil {
-		return nil, fmt.Errorf("all URLs failed: %w", lastErr)
+		return cacheEntry{}, fmt.Errorf("all URLs failed: %w", lastErr)
 	}
-	return nil, fmt.Errorf("no model IDs found in any URL")
+	return cacheEntry{}, fmt.Errorf("no model IDs found in any URL")
+}
+
+// cleanDocIDs applies a DocSource's exclude pattern and normalization steps
+// to raw scraped IDs in a single pass: each ID is excluded or transformed
+// (NormalizeRe, NormalizeFunc, Lowercase, then universal mode-suffix
+// stripping) and deduplicated as it goes, without intermediate slices.
+func cleanDocIDs(src DocSource, ids []string) []string {
+	seen := make(map[string]bool, len(ids))
+	cleaned := make([]string, 0, len(ids))
+	for _, id := range ids {
+		if src.ExcludePattern != nil && src.ExcludePattern.MatchString(id) {
+			continue
+		}
+		if src.NormalizeRe != nil {
+			id = src.NormalizeRe.ReplaceAllString(id, src.NormalizeRepl)
+		}
+		if src.NormalizeFunc != nil {
+			id = src.NormalizeFunc(id)
+		}
+		if src.Lowercase {
+			id = strings.ToLower(id)
+		}
+		// Universal: strip mode suffixes (e.g. -reasoning, -non-reasoning)
+		// so that variants collapse to their base model ID.
+		id = stripModeSuffixes(id)
+		if !seen[id] {
+			seen[id] = true
+			cleaned = append(cleaned, id)
+		}
+	}
+	return cleaned
 }
 
 // fetchAndExtract fetches a URL and extracts model IDs using a regex pattern.
-func fetchAndExtract(ctx context.Context, client *http.Client, url string, pattern *regexp.Regexp) ([]string, error) {
-	var lastErr error
-	for attempt := 1; attempt <= maxRetries; attempt++ {
+// If prev was fetched from the same URL, the request is conditional and a 304
+// returns prev unchanged.
+func fetchAndExtract(ctx context.Context, client *http.Client, url string, pattern *regexp.Regexp, prev *cacheEntry) (cacheEntry, error) {
+	resp, body, err := doWithRetry(ctx, client, func() (*http.Request, error) {
 		req, err := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
 		if err != nil {
 			return nil, err
 		}
-		req.Header.Set("User-Agent", "ModelRegistryUpdater/1.0")
+		req.Header.Set("User-Agent", userAgent)
 		req.Header.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
+		setConditionalHeaders(req, url, prev)
+		return req, nil
+	})
+	if err != nil {
+		return cacheEntry{}, err
+	}
+
+	if isNotModified(resp, url, prev) {
+		return prev.unchanged(), nil
+	}
+	if resp.StatusCode != http.StatusOK {
+		return cacheEntry{}, fmt.Errorf("HTTP %d from %s", resp.StatusCode, url)
+	}
+	return newCacheEntry(resp, url, extractIDs(pattern, body)), nil
+}
+
+// isTransientStatus reports whether an HTTP status signals a temporary
+// condition (rate limiting or an overloaded upstream) worth retrying.
+func isTransientStatus(code int) bool {
+	switch code {
+	case http.StatusTooManyRequests, http.StatusBadGateway,
+		http.StatusServiceUnavailable, http.StatusGatewayTimeout:
+		return true
+	}
+	return false
+}
 
-		resp, err := client.Do(req)
+// doWithRetry sends the request built by newReq and reads its body,
+// retrying up to maxRetries attempts in total on transport errors, failed
+// or truncated body reads, and transient statuses. Any other response,
+// including the last transient one, is returned with its body already read
+// and closed. Waits between attempts end early when ctx is done.
+func doWithRetry(ctx context.Context, client *http.Client, newReq func() (*http.Request, error)) (*http.Response, []byte, error) {
+	for attempt := 1; ; attempt++ {
+		req, err := newReq()
 		if err != nil {
-			lastErr = err
-			if attempt < maxRetries {
-				time.Sleep(time.Duration(attempt) * 2 * time.Second)
+			return nil, nil, err
+		}
+		resp, body, err := readResponse(client, req)
+		retryAfter := ""
+		switch {
+		case err != nil:
+			if attempt >= maxRetries || ctx.Err() != nil {
+				return nil, nil, err
 			}
-			continue
+		case isTransientStatus(resp.StatusCode) && attempt < maxRetries:
+			retryAfter = resp.Header.Get("Retry-After")
+		default:
+			return resp, body, nil
+		}
+		if err := sleepContext(ctx, retryDelay(attempt, retryAfter)); err != nil {
+			return nil, nil, err
 		}
+	}
+}
 
-		body, err := io.ReadAll(io.LimitReader(resp.Body, 2*1024*1024)) // 2MB max
-		resp.Body.Close()
+// readResponse sends req and reads up to maxResponseBody bytes of the
+// response body, so a connection dropped mid-body fails the whole attempt.
+func readResponse(client *http.Client, req *http.Request) (*http.Response, []byte, error) {
+	resp, err := client.Do(req)
+	if err != nil {
+		return nil, nil, err
+	}
+	defer resp.Body.Close()
+	body, err := io.ReadAll(io.LimitReader(resp.Body, maxResponseBody))
+	if err != nil {
+		return nil, nil, fmt.Errorf("reading response from %s: %w", req.URL, err)
+	}
+	return resp, body, nil
+}
 
-		if resp.StatusCode != http.StatusOK {
-			lastErr = fmt.Errorf("HTTP %d from %s", resp.StatusCode, url)
-			if attempt < maxRetries {
-				time.Sleep(time.Duration(attempt) * 2 * time.Second)
-			}
-			continue
+// retryDelay returns how long to wait after the given failed attempt. A
+// Retry-After value (delay in seconds or an HTTP date) takes precedence,
+// capped at maxRetryAfter; otherwise it is exponential backoff with jitter.
+func retryDelay(attempt int, retryAfter string) time.Duration {
+	if retryAfter != "" {
+		if secs, err := strconv.Atoi(retryAfter); err == nil && secs >= 0 {
+			return min(time.Duration(secs)*time.Second, maxRetryAfter)
 		}
-		if err != nil {
-			lastErr = err
-			continue
+		if at, err := http.ParseTime(retryAfter); err == nil {
+			return min(max(time.Until(at), 0), maxRetryAfter)
 		}
+	}
+	backoff := retryBaseDelay << (attempt - 1)
+	return backoff + time.Duration(rand.Int63n(int64(backoff)+1))
+}
 
-		// Extract unique model IDs using the regex pattern.
-		matches := pattern.FindAllStringSubmatch(string(body), -1)
-		seen := make(map[string]bool)
-		var ids []string
-		for _, m := range matches {
-			if len(m) >= 2 {
-				id := m[1]
-				if !seen[id] {
-					seen[id] = true
-					ids = append(ids, id)
-				}
-			}
+// sleepContext waits for d or until ctx is done, whichever comes first, and
+// returns ctx.Err() if the wait was cut short.
+func sleepContext(ctx context.Context, d time.Duration) error {
+	timer := time.NewTimer(d)
+	defer timer.Stop()
+	select {
+	case <-ctx.Done():
+		return ctx.Err()
+	case <-timer.C:
+		return nil
+	}
+}
+
+// extractIDs returns the unique first capture group of every pattern match
+// in body, in order of first appearance. Matching runs directly on the raw
+// bytes and only first-seen IDs are copied into strings, so a multi-megabyte
+// page is never duplicated as one large string.
+func extractIDs(pattern *regexp.Regexp, body []byte) []string {
+	seen := make(map[string]bool)
+	var ids []string
+	for _, loc := range pattern.FindAllSubmatchIndex(body, -1) {
+		if len(loc) < 4 || loc[2] < 0 {
+			continue
 		}
-		return ids, nil
+		match := body[loc[2]:loc[3]]
+		if seen[string(match)] {
+			continue
+		}
+		id := string(match)
+		seen[id] = true
+		ids = append(ids, id)
 	}
-	return nil, fmt.Errorf("all %d attempts failed: %w", maxRetries, lastErr)
+	return ids
 }
 
 // fingerprintModels computes a deterministic SHA-256 fingerprint for a set of
@@ -697,16 +1028,13 @@ func existingIssueWithFingerprint(ctx context.Context, client *http.Client, toke
 }
 
 // createGitHubIssue creates a GitHub issue with the given title, body, and
-// the "auto-update" label. Returns silently if GITHUB_TOKEN or GITHUB_REPO
-// environment variables are not set.
-func createGitHubIssue(ctx context.Context, client *http.Client, title, body string) {
-	token := os.Getenv("GITHUB_TOKEN")
-	repo := os.Getenv("GITHUB_REPO")
-	if token == "" || repo == "" {
+// the "auto-update" label. Returns silently if gh is not fully configured.
+func createGitHubIssue(ctx context.Context, client *http.Client, gh githubConfig, title, body string) {
+	if !gh.enabled() {
 		return
 	}
 
-	issueURL := fmt.Sprintf("https://api.github.com/repos/%s/issues", repo)
+	issueURL := fmt.Sprintf("https://api.github.com/repos/%s/issues", gh.Repo)
 	payload := map[string]any{
 		"title":  title,
 		"body":   body,
@@ -723,7 +1051,7 @@ func createGitHubIssue(ctx context.Context, client *http.Client, title, body str
 		fmt.Printf("[GitHub] failed to create issue request: %v\n", err)
 		return
 	}
-	issueReq.Header.Set("Authorization", "Bearer "+token)
+	issueReq.Header.Set("Authorization", "Bearer "+gh.Token)
 	issueReq.Header.Set("Accept", "application/vnd.github+json")
 	issueReq.Header.Set("Content-Type", "application/json")
 
@@ -749,15 +1077,13 @@ func createGitHubIssue(ctx context.Context, client *http.Client, title, body str
 // createNewModelsIssue creates a GitHub issue reporting newly detected model IDs.
 // It checks for existing open issues that already cover the same model IDs to
 // avoid duplicates.
-func createNewModelsIssue(ctx context.Context, client *http.Client, newModelIDs []string, reportBody string) {
-	token := os.Getenv("GITHUB_TOKEN")
-	repo := os.Getenv("GITHUB_REPO")
-	if token == "" || repo == "" {
+func createNewModelsIssue(ctx context.Context, client *http.Client, gh githubConfig, newModelIDs []string, reportBody string) {
+	if !gh.enabled() {
 		return
 	}
 
 	fp := fingerprintModels(newModelIDs)
-	if existingIssueWithFingerprint(ctx, client, token, repo, fp) {
+	if existingIssueWithFingerprint(ctx, client, gh.Token, gh.Repo, fp) {
 		fmt.Printf("[GitHub] Existing open issue already covers these new models (fingerprint match), skipping.\n")
 		return
 	}
@@ -782,7 +1108,7 @@ func createNewModelsIssue(ctx context.Context, client *http.Client, newModelIDs
 	body.WriteString("\n```\n</details>\n")
 	body.WriteString("\n<!-- fingerprint:" + fp + " -->\n")
 
-	createGitHubIssue(ctx, client, title, body.String())
+	createGitHubIssue(ctx, client, gh, title, body.String())
 }
 
 // createDeprecationIssue creates a GitHub issue reporting models that were
@@ -792,15 +1118,13 @@ func createNewModelsIssue(ctx context.Context, client *http.Client, newModelIDs
 // updating data_test.go counts, knownModels in main.go, and the model's Notes
 // field. Creating an issue lets a human (or CI-aware tool) handle all the
 // required changes properly.
-func createDeprecationIssue(ctx context.Context, client *http.Client, missingIDs []string, reportBody string) {
-	token := os.Getenv("GITHUB_TOKEN")
-	repo := os.Getenv("GITHUB_REPO")
-	if token == "" || repo == "" {
+func createDeprecationIssue(ctx context.Context, client *http.Client, gh githubConfig, missingIDs []string, reportBody string) {
+	if !gh.enabled() {
 		return
 	}
 
 	fp := fingerprintModels(missingIDs)
-	if existingIssueWithFingerprint(ctx, client, token, repo, fp) {
+	if existingIssueWithFingerprint(ctx, client, gh.Token, gh.Repo, fp) {
 		fmt.Printf("[GitHub] Existing open issue already covers these missing models (fingerprint match), skipping.\n")
 		return
 	}
@@ -828,7 +1152,7 @@ func createDeprecationIssue(ctx context.Context, client *http.Client, missingIDs
 	body.WriteString("\n```\n</details>\n")
 	body.WriteString("\n<!-- fingerprint:" + fp + " -->\n")
 
-	createGitHubIssue(ctx, client, title, body.String())
+	createGitHubIssue(ctx, client, gh, title, body.String())
 }
 
 // modeSuffixes lists well-known mode/variant suffixes that providers append
@@ -1026,9 +1350,13 @@ func hasVariantInDocs(knownID string, docSet map[string]bool) bool {
 // and IDs in known but absent from docs (missing), filtering out date-stamp
 // variants and known aliases from the "new" list.
 func diff(known map[string]bool, docIDs []string) (newModels, missing []string) {
-	docSet := make(map[string]bool, len(docIDs))
-	for _, id := range docIDs {
-		docSet[id] = true
+	// Nothing upstream: every tracked model is missing and there are no doc
+	// IDs to match variants against.
+	if len(docIDs) == 0 {
+		for id := range known {
+			missing = append(missing, id)
+		}
+		return nil, missing
 	}
 
 	for _, id := range docIDs {
@@ -1048,6 +1376,15 @@ func diff(known map[string]bool, docIDs []string) (newModels, missing []string)
 		newModels = append(newModels, id)
 	}
 
+	// Nothing tracked: nothing can be missing, so skip building the doc set.
+	if len(known) == 0 {
+		return newModels, nil
+	}
+
+	docSet := make(map[string]bool, len(docIDs))
+	for _, id := range docIDs {
+		docSet[id] = true
+	}
 	for id := range known {
 		if docSet[id] {
 			continue
@@ -6,8 +6,11 @@ import (
 	"fmt"
 	"net/http"
 	"net/http/httptest"
+	"os"
+	"regexp"
 	"sort"
 	"strings"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -91,6 +94,25 @@ func TestDiff_EmptyKnownModels(t *testing.T) {
 	}
 }
 
+func TestDiff_BothEmpty(t *testing.T) {
+	newModels, missing := diff(map[string]bool{}, nil)
+	if len(newModels) != 0 || len(missing) != 0 {
+		t.Errorf("expected empty diff, got new=%v missing=%v", newModels, missing)
+	}
+}
+
+func TestDiff_EmptyKnownStillFilters(t *testing.T) {
+	// Date stamps and IDs already in the registry are not new, even when
+	// nothing is tracked for the provider.
+	newModels, missing := diff(map[string]bool{}, []string{"gpt-5", "gpt-9-2025-08-07", "brand-new-model"})
+	if len(newModels) != 1 || newModels[0] != "brand-new-model" {
+		t.Errorf("expected new=[brand-new-model], got %v", newModels)
+	}
+	if len(missing) != 0 {
+		t.Errorf("expected no missing, got %v", missing)
+	}
+}
+
 // ---------------------------------------------------------------------------
 // knownModels ↔ models.Models cross-reference tests
 // ---------------------------------------------------------------------------
@@ -150,6 +172,30 @@ func TestKnownModels_AllProvidersPresent(t *testing.T) {
 	}
 }
 
+func TestKnownModels_EveryProviderReported(t *testing.T) {
+	reported := make(map[string]int)
+	for _, name := range providerOrder {
+		reported[name]++
+		if _, ok := docSources[name]; !ok {
+			t.Errorf("provider %q is in providerOrder but has no doc source", name)
+		}
+	}
+	for _, res := range manualResults() {
+		reported[res.Name]++
+		if res.SkipReason == "" {
+			t.Errorf("manual provider %q has no skip reason", res.Name)
+		}
+	}
+	for provider := range knownModels {
+		if reported[provider] != 1 {
+			t.Errorf("provider %q appears %d times across providerOrder and manualProviders, want 1", provider, reported[provider])
+		}
+	}
+	if len(reported) != len(knownModels) {
+		t.Errorf("report covers %d providers, knownModels has %d", len(reported), len(knownModels))
+	}
+}
+
 // ---------------------------------------------------------------------------
 // isDateStampVariant tests
 // ---------------------------------------------------------------------------
@@ -778,6 +824,62 @@ func TestOpenAIPattern(t *testing.T) {
 	}
 }
 
+// ---------------------------------------------------------------------------
+// cleanDocIDs tests
+// ---------------------------------------------------------------------------
+
+func TestCleanDocIDs(t *testing.T) {
+	got := cleanDocIDs(docSources["xAI"], []string{
+		"grok-4-1-fast-reasoning",
+		"grok-4-1-fast-non-reasoning",
+		"grok-2-vision-1212",
+		"grok-4",
+	})
+	want := []string{"grok-4.1-fast", "grok-4"}
+	if len(got) != len(want) {
+		t.Fatalf("expected %v, got %v", want, got)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Errorf("index %d: expected %q, got %q", i, want[i], got[i])
+		}
+	}
+
+	// Lowercasing happens before dedup, so case variants collapse
+	got = cleanDocIDs(docSources["Zhipu"], []string{"GLM-5", "glm-5", "GLM-4.7-Flash"})
+	if len(got) != 2 || got[0] != "glm-5" || got[1] != "glm-4.7-flash" {
+		t.Errorf("expected [glm-5 glm-4.7-flash], got %v", got)
+	}
+
+	if got := cleanDocIDs(docSources["DeepSeek"], nil); len(got) != 0 {
+		t.Errorf("expected empty result for no input, got %v", got)
+	}
+}
+
+// ---------------------------------------------------------------------------
+// extractIDs tests
+// ---------------------------------------------------------------------------
+
+func TestExtractIDs(t *testing.T) {
+	body := []byte(`<td>deepseek-chat</td><td>deepseek-reasoner</td><code>deepseek-chat</code>`)
+	got := extractIDs(docSources["DeepSeek"].Pattern, body)
+	if len(got) != 2 || got[0] != "deepseek-chat" || got[1] != "deepseek-reasoner" {
+		t.Errorf("expected [deepseek-chat deepseek-reasoner], got %v", got)
+	}
+
+	if got := extractIDs(docSources["DeepSeek"].Pattern, []byte("no models here")); len(got) != 0 {
+		t.Errorf("expected no IDs, got %v", got)
+	}
+
+	// Returned IDs must not alias the body buffer
+	body = []byte("deepseek-v3")
+	got = extractIDs(docSources["DeepSeek"].Pattern, body)
+	copy(body, "xxxxxxxxxxx")
+	if len(got) != 1 || got[0] != "deepseek-v3" {
+		t.Errorf("expected [deepseek-v3] to survive body reuse, got %v", got)
+	}
+}
+
 // ---------------------------------------------------------------------------
 // fingerprintModels tests
 // ---------------------------------------------------------------------------
@@ -888,6 +990,61 @@ func TestApplyNormalization(t *testing.T) {
 	}
 }
 
+func TestApplyNormalization_IgnoreIDsAreExact(t *testing.T) {
+	if !loadNormalization().ignoreIDs["xai"]["grok-2"] {
+		t.Fatal("expected grok-2 in xai ignore_ids")
+	}
+	got := applyNormalization("xai", []string{"grok-2", "grok-2-1212", "grok-20", "grok-4"})
+	kept := map[string]bool{}
+	for _, id := range got {
+		kept[id] = true
+	}
+	if kept["grok-2"] || kept["grok-2-1212"] {
+		t.Errorf("expected grok-2 and grok-2-1212 to be ignored, got %v", got)
+	}
+	if !kept["grok-20"] || !kept["grok-4"] {
+		t.Errorf("expected grok-20 and grok-4 to survive, got %v", got)
+	}
+}
+
+func TestCompileAlternation(t *testing.T) {
+	re := compileAlternation([]string{"-latest$", "^mistral-embed", "(?i)^GROK-2(-|$)"})
+	if re == nil {
+		t.Fatal("expected combined regex, got nil")
+	}
+	tests := []struct {
+		id   string
+		want bool
+	}{
+		{"mistral-large-latest", true},
+		{"mistral-embed-23", true},
+		{"grok-2-1212", true},
+		{"grok-2", true},
+		{"mistral-large-2512", false},
+		{"grok-3", false},
+		{"latest-model", false},
+	}
+	for _, tt := range tests {
+		if got := re.MatchString(tt.id); got != tt.want {
+			t.Errorf("combined.MatchString(%q) = %v, want %v", tt.id, got, tt.want)
+		}
+	}
+
+	// Invalid patterns are skipped; valid ones still apply
+	re = compileAlternation([]string{"([unclosed", "-beta$"})
+	if re == nil || !re.MatchString("grok-3-beta") {
+		t.Error("expected valid pattern to survive alongside an invalid one")
+	}
+
+	// Nothing usable yields nil
+	if compileAlternation(nil) != nil {
+		t.Error("expected nil for no patterns")
+	}
+	if compileAlternation([]string{"([unclosed"}) != nil {
+		t.Error("expected nil when every pattern is invalid")
+	}
+}
+
 func TestApplyNormalizationXAI(t *testing.T) {
 	xaiIDs := applyNormalization("xai", []string{
 		"grok-4",
@@ -928,6 +1085,7 @@ func TestApplyNormalizationXAI(t *testing.T) {
 // ---------------------------------------------------------------------------
 
 func TestFetchModelsFromAPI(t *testing.T) {
+	fastRetries(t)
 	// Mock a /v1/models endpoint
 	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
 		if r.Header.Get("Authorization") != "Bearer test-key" {
@@ -949,24 +1107,516 @@ func TestFetchModelsFromAPI(t *testing.T) {
 	client := &http.Client{Timeout: 5 * time.Second}
 
 	// Success case
-	ids, err := fetchModelsFromAPI(ctx, client, ts.URL, "test-key")
+	entry, err := fetchModelsFromAPI(ctx, client, ts.URL, "test-key", nil)
 	if err != nil {
 		t.Fatalf("unexpected error: %v", err)
 	}
-	if len(ids) != 3 {
-		t.Errorf("expected 3 models, got %d", len(ids))
+	if len(entry.Models) != 3 {
+		t.Errorf("expected 3 models, got %d", len(entry.Models))
 	}
 
 	// Auth failure
-	_, err = fetchModelsFromAPI(ctx, client, ts.URL, "wrong-key")
+	_, err = fetchModelsFromAPI(ctx, client, ts.URL, "wrong-key", nil)
 	if err == nil {
 		t.Error("expected error for wrong API key")
 	}
 
 	// Invalid URL
-	_, err = fetchModelsFromAPI(ctx, client, "http://localhost:1/nonexistent", "key")
+	_, err = fetchModelsFromAPI(ctx, client, "http://localhost:1/nonexistent", "key", nil)
 	if err == nil {
 		t.Error("expected error for invalid URL")
 	}
 }
 
+// ---------------------------------------------------------------------------
+// newHTTPClient tests
+// ---------------------------------------------------------------------------
+
+func TestNewHTTPClient(t *testing.T) {
+	client := newHTTPClient()
+	if client.Timeout != 30*time.Second {
+		t.Errorf("expected 30s timeout, got %v", client.Timeout)
+	}
+	transport, ok := client.Transport.(*http.Transport)
+	if !ok {
+		t.Fatalf("expected *http.Transport, got %T", client.Transport)
+	}
+	if !transport.ForceAttemptHTTP2 {
+		t.Error("expected HTTP/2 to be attempted")
+	}
+	if transport.MaxIdleConnsPerHost != 20 {
+		t.Errorf("expected 20 idle conns per host, got %d", transport.MaxIdleConnsPerHost)
+	}
+	if transport == http.DefaultTransport {
+		t.Error("expected a cloned transport, not http.DefaultTransport")
+	}
+}
+
+// ---------------------------------------------------------------------------
+// environment snapshot tests
+// ---------------------------------------------------------------------------
+
+func TestLoadAPIKeys(t *testing.T) {
+	t.Setenv("OPENAI_API_KEY", "sk-test")
+	t.Setenv("DEEPSEEK_API_KEY", "")
+	t.Setenv("MISTRAL_API_KEY", "")
+	t.Setenv("XAI_API_KEY", "")
+
+	keys := loadAPIKeys()
+	if keys["OpenAI"] != "sk-test" {
+		t.Errorf("expected OpenAI key to be captured, got %q", keys["OpenAI"])
+	}
+	if _, ok := keys["DeepSeek"]; ok {
+		t.Error("expected providers with empty keys to be omitted")
+	}
+	if len(keys) != 1 {
+		t.Errorf("expected 1 key, got %d: %v", len(keys), keys)
+	}
+}
+
+func TestGitHubConfigEnabled(t *testing.T) {
+	tests := []struct {
+		gh   githubConfig
+		want bool
+	}{
+		{githubConfig{Token: "t", Repo: "o/r"}, true},
+		{githubConfig{Token: "t"}, false},
+		{githubConfig{Repo: "o/r"}, false},
+		{githubConfig{}, false},
+	}
+	for _, tt := range tests {
+		if got := tt.gh.enabled(); got != tt.want {
+			t.Errorf("%+v.enabled() = %v, want %v", tt.gh, got, tt.want)
+		}
+	}
+}
+
+// ---------------------------------------------------------------------------
+// checkProvider tests
+// ---------------------------------------------------------------------------
+
+func TestCheckProvider(t *testing.T) {
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path == "/empty" {
+			w.Write([]byte("<html>nothing here</html>"))
+			return
+		}
+		w.Write([]byte("<td>deepseek-chat</td><td>deepseek-reasoner</td><td>deepseek-v99</td>"))
+	}))
+	defer ts.Close()
+
+	ctx := context.Background()
+	client := &http.Client{Timeout: 5 * time.Second}
+	src := docSources["DeepSeek"]
+
+	// Docs scraping path with one genuinely new model
+	src.URLs = []string{ts.URL + "/models"}
+	res := checkProvider(ctx, client, nil, "DeepSeek", src, "")
+	if res.Err != nil {
+		t.Fatalf("unexpected error: %v", res.Err)
+	}
+	if res.Known != len(knownModels["DeepSeek"]) {
+		t.Errorf("expected Known=%d, got %d", len(knownModels["DeepSeek"]), res.Known)
+	}
+	if len(res.New) != 1 || res.New[0] != "deepseek-v99" {
+		t.Errorf("expected new=[deepseek-v99], got %v", res.New)
+	}
+	if len(res.Missing) != 0 {
+		t.Errorf("expected no missing, got %v", res.Missing)
+	}
+
+	// No IDs on the page surfaces as an error rather than a false diff
+	src.URLs = []string{ts.URL + "/empty"}
+	res = checkProvider(ctx, client, nil, "DeepSeek", src, "")
+	if res.Err == nil {
+		t.Error("expected error when docs contain no model IDs")
+	}
+	if len(res.New) != 0 || len(res.Missing) != 0 {
+		t.Errorf("expected no diff on error, got new=%v missing=%v", res.New, res.Missing)
+	}
+}
+
+// overrideDocURL points a provider's doc source at url for the rest of the test.
+func overrideDocURL(t *testing.T, name, url string) {
+	t.Helper()
+	orig := docSources[name]
+	src := orig
+	src.URLs = []string{url}
+	docSources[name] = src
+	t.Cleanup(func() { docSources[name] = orig })
+}
+
+func TestCheckProviders(t *testing.T) {
+	fast := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte("deepseek-chat deepseek-reasoner"))
+	}))
+	defer fast.Close()
+	hung := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		<-r.Context().Done()
+	}))
+	defer hung.Close()
+
+	overrideDocURL(t, "DeepSeek", fast.URL)
+	overrideDocURL(t, "Zhipu", hung.URL)
+
+	ctx := context.Background()
+	client := &http.Client{Timeout: 5 * time.Second}
+	start := time.Now()
+	results := checkProviders(ctx, client, nil, nil, []string{"Zhipu", "NoSuchProvider", "DeepSeek"}, 200*time.Millisecond)
+	if elapsed := time.Since(start); elapsed > 3*time.Second {
+		t.Errorf("expected the hung provider to be cut off by its timeout, run took %v", elapsed)
+	}
+
+	if len(results) != 3 {
+		t.Fatalf("expected 3 results, got %d", len(results))
+	}
+	if results[0].Name != "Zhipu" || results[0].Err == nil {
+		t.Errorf("expected Zhipu to time out with an error, got %+v", results[0])
+	}
+	if results[1].Name != "NoSuchProvider" || results[1].SkipReason == "" {
+		t.Errorf("expected unknown provider to be skipped, got %+v", results[1])
+	}
+	if results[2].Name != "DeepSeek" || results[2].Err != nil || len(results[2].IDs) != 2 {
+		t.Errorf("expected DeepSeek to succeed with 2 IDs, got %+v", results[2])
+	}
+}
+
+func TestSleepContext(t *testing.T) {
+	if err := sleepContext(context.Background(), time.Millisecond); err != nil {
+		t.Errorf("expected nil after full sleep, got %v", err)
+	}
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	start := time.Now()
+	if err := sleepContext(ctx, time.Minute); err == nil {
+		t.Error("expected error when context is already cancelled")
+	}
+	if time.Since(start) > time.Second {
+		t.Error("expected cancelled sleep to return immediately")
+	}
+}
+
+// ---------------------------------------------------------------------------
+// retry tests
+// ---------------------------------------------------------------------------
+
+// fastRetries shrinks the backoff so retry tests do not sleep for seconds.
+func fastRetries(t *testing.T) {
+	orig := retryBaseDelay
+	retryBaseDelay = time.Millisecond
+	t.Cleanup(func() { retryBaseDelay = orig })
+}
+
+// countingServer answers each request with the handler for its 1-based
+// sequence number and reports how many requests it has served.
+func countingServer(t *testing.T, handle func(n int32, w http.ResponseWriter)) (*httptest.Server, *atomic.Int32) {
+	var hits atomic.Int32
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		handle(hits.Add(1), w)
+	}))
+	t.Cleanup(ts.Close)
+	return ts, &hits
+}
+
+func TestRetryDelay(t *testing.T) {
+	if got := retryDelay(1, "2"); got != 2*time.Second {
+		t.Errorf("Retry-After seconds: got %v, want 2s", got)
+	}
+	if got := retryDelay(1, "3600"); got != maxRetryAfter {
+		t.Errorf("long Retry-After: got %v, want cap %v", got, maxRetryAfter)
+	}
+	if got := retryDelay(1, time.Now().Add(-time.Hour).UTC().Format(http.TimeFormat)); got != 0 {
+		t.Errorf("past Retry-After date: got %v, want 0", got)
+	}
+	for attempt := 1; attempt <= 3; attempt++ {
+		base := retryBaseDelay << (attempt - 1)
+		for _, ra := range []string{"", "soon"} {
+			if got := retryDelay(attempt, ra); got < base || got > 2*base {
+				t.Errorf("attempt %d, Retry-After %q: got %v, want within [%v, %v]", attempt, ra, got, base, 2*base)
+			}
+		}
+	}
+}
+
+func TestFetchAndExtract_RetriesTransientStatus(t *testing.T) {
+	fastRetries(t)
+	ts, hits := countingServer(t, func(n int32, w http.ResponseWriter) {
+		switch n {
+		case 1:
+			w.WriteHeader(http.StatusServiceUnavailable)
+		case 2:
+			w.Header().Set("Retry-After", "0")
+			w.WriteHeader(http.StatusTooManyRequests)
+		default:
+			fmt.Fprint(w, "model-a model-b")
+		}
+	})
+
+	entry, err := fetchAndExtract(context.Background(), ts.Client(), ts.URL, regexp.MustCompile(`(model-[a-z])`), nil)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(entry.Models) != 2 {
+		t.Errorf("expected 2 models, got %v", entry.Models)
+	}
+	if got := hits.Load(); got != 3 {
+		t.Errorf("expected 3 requests, got %d", got)
+	}
+}
+
+func TestFetchAndExtract_RetriesTruncatedBody(t *testing.T) {
+	fastRetries(t)
+	ts, hits := countingServer(t, func(n int32, w http.ResponseWriter) {
+		if n == 1 {
+			// Promise more than is sent so the client sees an unexpected EOF.
+			w.Header().Set("Content-Length", "1000")
+			fmt.Fprint(w, "model-a")
+			return
+		}
+		fmt.Fprint(w, "model-a model-b")
+	})
+
+	entry, err := fetchAndExtract(context.Background(), ts.Client(), ts.URL, regexp.MustCompile(`(model-[a-z])`), nil)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(entry.Models) != 2 || hits.Load() != 2 {
+		t.Errorf("expected 2 models after 2 requests, got %v after %d", entry.Models, hits.Load())
+	}
+}
+
+func TestFetchModelsFromAPI_GivesUpAfterMaxRetries(t *testing.T) {
+	fastRetries(t)
+	ts, hits := countingServer(t, func(n int32, w http.ResponseWriter) {
+		w.WriteHeader(http.StatusBadGateway)
+	})
+
+	_, err := fetchModelsFromAPI(context.Background(), ts.Client(), ts.URL, "key", nil)
+	if err == nil || !strings.Contains(err.Error(), "502") {
+		t.Errorf("expected HTTP 502 error, got %v", err)
+	}
+	if got := hits.Load(); got != maxRetries {
+		t.Errorf("expected %d requests, got %d", maxRetries, got)
+	}
+}
+
+func TestFetchAndExtract_NoRetryOnPermanentStatus(t *testing.T) {
+	fastRetries(t)
+	ts, hits := countingServer(t, func(n int32, w http.ResponseWriter) {
+		w.WriteHeader(http.StatusNotFound)
+	})
+
+	if _, err := fetchAndExtract(context.Background(), ts.Client(), ts.URL, regexp.MustCompile(`(x)`), nil); err == nil {
+		t.Error("expected error for HTTP 404")
+	}
+	if got := hits.Load(); got != 1 {
+		t.Errorf("expected a single request for a 404, got %d", got)
+	}
+}
+
+func TestFetchModelsFromAPI_RetriesTimeout(t *testing.T) {
+	fastRetries(t)
+	release := make(chan struct{})
+	defer close(release)
+	ts, hits := countingServer(t, func(n int32, w http.ResponseWriter) {
+		if n == 1 {
+			<-release // hang until the client gives up
+			return
+		}
+		fmt.Fprint(w, `{"data":[{"id":"m1"}]}`)
+	})
+	client := ts.Client()
+	client.Timeout = 100 * time.Millisecond
+
+	entry, err := fetchModelsFromAPI(context.Background(), client, ts.URL, "key", nil)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(entry.Models) != 1 || hits.Load() != 2 {
+		t.Errorf("expected 1 model after 2 requests, got %v after %d", entry.Models, hits.Load())
+	}
+}
+
+// ---------------------------------------------------------------------------
+// modelCache tests
+// ---------------------------------------------------------------------------
+
+func TestModelCache_RoundTrip(t *testing.T) {
+	cache := &modelCache{dir: t.TempDir() + "/nested"}
+
+	if _, _, ok := cache.read("OpenAI"); ok {
+		t.Error("expected miss on empty cache")
+	}
+	if err := cache.write("OpenAI", cacheEntry{Models: []string{"gpt-5", "o3"}, ETag: `"v1"`}); err != nil {
+		t.Fatalf("write failed: %v", err)
+	}
+	entry, age, ok := cache.read("OpenAI")
+	if !ok {
+		t.Fatal("expected hit after write")
+	}
+	if len(entry.Models) != 2 || entry.Models[0] != "gpt-5" || entry.Models[1] != "o3" {
+		t.Errorf("expected [gpt-5 o3], got %v", entry.Models)
+	}
+	if entry.ETag != `"v1"` {
+		t.Errorf("expected ETag to round-trip, got %q", entry.ETag)
+	}
+	if age < 0 || age > time.Minute {
+		t.Errorf("expected fresh entry, got age %v", age)
+	}
+
+	// Provider names are case-insensitive on disk
+	if _, _, ok := cache.read("openai"); !ok {
+		t.Error("expected lowercase provider name to hit the same entry")
+	}
+}
+
+func TestModelCache_NilIsDisabled(t *testing.T) {
+	var cache *modelCache
+	if err := cache.write("OpenAI", cacheEntry{Models: []string{"gpt-5"}}); err != nil {
+		t.Errorf("expected nil cache write to be a no-op, got %v", err)
+	}
+	if _, _, ok := cache.read("OpenAI"); ok {
+		t.Error("expected nil cache to always miss")
+	}
+}
+
+func TestCheckProvider_Cache(t *testing.T) {
+	hits := 0
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		hits++
+		w.Write([]byte("nothing to see"))
+	}))
+	defer ts.Close()
+
+	ctx := context.Background()
+	client := &http.Client{Timeout: 5 * time.Second}
+	src := docSources["DeepSeek"]
+	src.URLs = []string{ts.URL}
+	cache := &modelCache{dir: t.TempDir()}
+	if err := cache.write("DeepSeek", cacheEntry{Models: []string{"deepseek-chat", "deepseek-reasoner"}}); err != nil {
+		t.Fatalf("write failed: %v", err)
+	}
+
+	// Fresh entry: no request is made
+	res := checkProvider(ctx, client, cache, "DeepSeek", src, "")
+	if hits != 0 {
+		t.Errorf("expected no requests on a fresh cache hit, got %d", hits)
+	}
+	if res.Err != nil || len(res.New) != 0 || len(res.Missing) != 0 {
+		t.Errorf("expected in-sync result from cache, got err=%v new=%v missing=%v", res.Err, res.New, res.Missing)
+	}
+
+	// Stale entry: fetch is attempted, fails, and the stale listing is used
+	old := time.Now().Add(-2 * cacheTTL)
+	if err := os.Chtimes(cache.path("DeepSeek"), old, old); err != nil {
+		t.Fatalf("chtimes failed: %v", err)
+	}
+	res = checkProvider(ctx, client, cache, "DeepSeek", src, "")
+	if hits == 0 {
+		t.Error("expected a request once the cache entry is stale")
+	}
+	if res.Err != nil {
+		t.Errorf("expected stale fallback instead of error, got %v", res.Err)
+	}
+	if !res.Stale {
+		t.Error("expected stale fallback to be flagged")
+	}
+	if len(res.IDs) != 2 {
+		t.Errorf("expected 2 IDs from stale cache, got %v", res.IDs)
+	}
+	if !strings.Contains(strings.Join(res.Notes, ""), "stale cached listing") {
+		t.Errorf("expected stale-cache warning in notes, got %v", res.Notes)
+	}
+
+	// Past maxStaleAge the cached listing is not used at all
+	old = time.Now().Add(-2 * maxStaleAge)
+	if err := os.Chtimes(cache.path("DeepSeek"), old, old); err != nil {
+		t.Fatalf("chtimes failed: %v", err)
+	}
+	res = checkProvider(ctx, client, cache, "DeepSeek", src, "")
+	if res.Err == nil || res.Stale {
+		t.Errorf("expected an error once the cache is too old, got err=%v stale=%v", res.Err, res.Stale)
+	}
+}
+
+func TestCheckProvider_ConditionalGet(t *testing.T) {
+	fullBodies := 0
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Header.Get("If-None-Match") == `"v1"` {
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+		fullBodies++
+		w.Header().Set("ETag", `"v1"`)
+		w.Write([]byte("deepseek-chat deepseek-reasoner"))
+	}))
+	defer ts.Close()
+
+	ctx := context.Background()
+	client := &http.Client{Timeout: 5 * time.Second}
+	src := docSources["DeepSeek"]
+	src.URLs = []string{ts.URL}
+	cache := &modelCache{dir: t.TempDir()}
+
+	// First run downloads the page and stores its ETag
+	res := checkProvider(ctx, client, cache, "DeepSeek", src, "")
+	if res.Err != nil {
+		t.Fatalf("unexpected error: %v", res.Err)
+	}
+	entry, _, ok := cache.read("DeepSeek")
+	if !ok || entry.ETag != `"v1"` || entry.URL != ts.URL {
+		t.Fatalf("expected cached entry with ETag and URL, got %+v (ok=%v)", entry, ok)
+	}
+
+	// Once stale, the next run revalidates and gets a 304
+	old := time.Now().Add(-2 * cacheTTL)
+	if err := os.Chtimes(cache.path("DeepSeek"), old, old); err != nil {
+		t.Fatalf("chtimes failed: %v", err)
+	}
+	res = checkProvider(ctx, client, cache, "DeepSeek", src, "")
+	if res.Err != nil {
+		t.Fatalf("unexpected error: %v", res.Err)
+	}
+	if fullBodies != 1 {
+		t.Errorf("expected 1 full download, got %d", fullBodies)
+	}
+	if len(res.IDs) != 2 {
+		t.Errorf("expected 2 IDs from revalidated cache, got %v", res.IDs)
+	}
+	if !strings.Contains(strings.Join(res.Notes, ""), "HTTP 304") {
+		t.Errorf("expected 304 note, got %v", res.Notes)
+	}
+	if _, age, _ := cache.read("DeepSeek"); age > time.Minute {
+		t.Errorf("expected revalidation to refresh the cache entry, age is %v", age)
+	}
+}
+
+// ---------------------------------------------------------------------------
+// writeIDList tests
+// ---------------------------------------------------------------------------
+
+func TestWriteIDList(t *testing.T) {
+	var b strings.Builder
+	writeIDList(&b, "+", []string{"a", "b"})
+	if got := b.String(); got != "    + a\n    + b\n" {
+		t.Errorf("unexpected short list output: %q", got)
+	}
+
+	ids := make([]string, maxReportItems+7)
+	for i := range ids {
+		ids[i] = fmt.Sprintf("model-%03d", i)
+	}
+	b.Reset()
+	writeIDList(&b, "-", ids)
+	out := b.String()
+	lines := strings.Split(strings.TrimSuffix(out, "\n"), "\n")
+	if len(lines) != maxReportItems+1 {
+		t.Errorf("expected %d lines, got %d", maxReportItems+1, len(lines))
+	}
+	if !strings.HasSuffix(out, "    ... and 7 more\n") {
+		t.Errorf("expected truncation footer, got %q", lines[len(lines)-1])
+	}
+	if strings.Contains(out, ids[maxReportItems]) {
+		t.Errorf("expected %q to be left out", ids[maxReportItems])
+	}
+}
@@ -2,47 +2,68 @@ package models
 
 import (
 	"regexp"
+	"sort"
+	"strings"
 	"testing"
 )
 
+// forEachModel runs check as a parallel subtest for every registry entry,
+// named after its map key, so a failure points straight at the offending
+// model and the per-model checks run concurrently.
+func forEachModel(t *testing.T, check func(t *testing.T, key string, m Model)) {
+	keys := make([]string, 0, len(Models))
+	for k := range Models {
+		keys = append(keys, k)
+	}
+	sort.Strings(keys)
+	for i := range keys {
+		key := keys[i]
+		m := Models[key]
+		t.Run(key, func(t *testing.T) {
+			t.Parallel()
+			check(t, key, m)
+		})
+	}
+}
+
 func TestAllModelsHaveRequiredFields(t *testing.T) {
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if m.ID == "" {
-			t.Errorf("%s: missing ID", key)
+			t.Error("missing ID")
 		}
 		if m.DisplayName == "" {
-			t.Errorf("%s: missing DisplayName", key)
+			t.Error("missing DisplayName")
 		}
 		if m.Provider == "" {
-			t.Errorf("%s: missing Provider", key)
+			t.Error("missing Provider")
 		}
 		if m.ContextWindow == 0 {
-			t.Errorf("%s: ContextWindow is zero", key)
+			t.Error("ContextWindow is zero")
 		}
 		if m.MaxOutputTokens == 0 {
-			t.Errorf("%s: MaxOutputTokens is zero", key)
+			t.Error("MaxOutputTokens is zero")
 		}
 		if m.KnowledgeCutoff == "" {
-			t.Errorf("%s: missing KnowledgeCutoff", key)
+			t.Error("missing KnowledgeCutoff")
 		}
 		if m.ReleaseDate == "" {
-			t.Errorf("%s: missing ReleaseDate", key)
+			t.Error("missing ReleaseDate")
 		}
 		if m.Status == "" {
-			t.Errorf("%s: missing Status", key)
+			t.Error("missing Status")
 		}
 		if m.Notes == "" {
-			t.Errorf("%s: missing Notes", key)
+			t.Error("missing Notes")
 		}
-	}
+	})
 }
 
 func TestModelIDMatchesMapKey(t *testing.T) {
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if key != m.ID {
 			t.Errorf("map key %q != model ID %q", key, m.ID)
 		}
-	}
+	})
 }
 
 func TestStatusValuesAreValid(t *testing.T) {
@@ -51,39 +72,50 @@ func TestStatusValuesAreValid(t *testing.T) {
 		"legacy":     true,
 		"deprecated": true,
 	}
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if !valid[m.Status] {
-			t.Errorf("%s: invalid status %q", key, m.Status)
+			t.Errorf("invalid status %q", m.Status)
 		}
-	}
+	})
 }
 
 func TestPricingIsNonNegative(t *testing.T) {
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if m.PricingInput < 0 {
-			t.Errorf("%s: negative input pricing %f", key, m.PricingInput)
+			t.Errorf("negative input pricing %f", m.PricingInput)
 		}
 		if m.PricingOutput < 0 {
-			t.Errorf("%s: negative output pricing %f", key, m.PricingOutput)
+			t.Errorf("negative output pricing %f", m.PricingOutput)
 		}
-	}
+	})
 }
 
 func TestContextWindowIsPositive(t *testing.T) {
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if m.ContextWindow <= 0 {
-			t.Errorf("%s: non-positive context window %d", key, m.ContextWindow)
+			t.Errorf("non-positive context window %d", m.ContextWindow)
 		}
-	}
+	})
 }
 
 func TestAtLeastThreeProviders(t *testing.T) {
-	providers := make(map[string]bool)
-	for _, m := range Models {
-		providers[m.Provider] = true
+	if len(ByProvider) < 3 {
+		t.Errorf("expected at least 3 providers, got %d", len(ByProvider))
 	}
-	if len(providers) < 3 {
-		t.Errorf("expected at least 3 providers, got %d", len(providers))
+}
+
+func TestByProvider_CoversRegistry(t *testing.T) {
+	total := 0
+	for p, ms := range ByProvider {
+		for _, m := range ms {
+			if strings.ToLower(m.Provider) != p {
+				t.Errorf("model %s indexed under %q but provider is %q", m.ID, p, m.Provider)
+			}
+		}
+		total += len(ms)
+	}
+	if total != len(Models) {
+		t.Errorf("index holds %d models, registry has %d", total, len(Models))
 	}
 }
 
@@ -138,39 +170,39 @@ func TestProviderCounts(t *testing.T) {
 }
 
 func TestMaxOutputTokensIsPositive(t *testing.T) {
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if m.MaxOutputTokens <= 0 {
-			t.Errorf("%s: non-positive MaxOutputTokens %d", key, m.MaxOutputTokens)
+			t.Errorf("non-positive MaxOutputTokens %d", m.MaxOutputTokens)
 		}
-	}
+	})
 }
 
 func TestMaxOutputDoesNotExceedContext(t *testing.T) {
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if m.MaxOutputTokens > m.ContextWindow {
-			t.Errorf("%s: MaxOutputTokens (%d) > ContextWindow (%d)", key, m.MaxOutputTokens, m.ContextWindow)
+			t.Errorf("MaxOutputTokens (%d) > ContextWindow (%d)", m.MaxOutputTokens, m.ContextWindow)
 		}
-	}
+	})
 }
 
 func TestOutputPricingAtLeastInputPricing(t *testing.T) {
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if m.PricingOutput < m.PricingInput {
-			t.Errorf("%s: output pricing $%.2f < input pricing $%.2f", key, m.PricingOutput, m.PricingInput)
+			t.Errorf("output pricing $%.2f < input pricing $%.2f", m.PricingOutput, m.PricingInput)
 		}
-	}
+	})
 }
 
 func TestDateFormats(t *testing.T) {
 	dateRe := regexp.MustCompile(`^\d{4}-(0[1-9]|1[0-2])$`)
-	for key, m := range Models {
+	forEachModel(t, func(t *testing.T, key string, m Model) {
 		if !dateRe.MatchString(m.KnowledgeCutoff) {
-			t.Errorf("%s: KnowledgeCutoff %q does not match YYYY-MM format", key, m.KnowledgeCutoff)
+			t.Errorf("KnowledgeCutoff %q does not match YYYY-MM format", m.KnowledgeCutoff)
 		}
 		if !dateRe.MatchString(m.ReleaseDate) {
-			t.Errorf("%s: ReleaseDate %q does not match YYYY-MM format", key, m.ReleaseDate)
+			t.Errorf("ReleaseDate %q does not match YYYY-MM format", m.ReleaseDate)
 		}
-	}
+	})
 }
 
 func TestNoDuplicateDisplayNames(t *testing.T) {
@@ -202,7 +234,10 @@ func TestFormatInt(t *testing.T) {
 		{1000, "1,000"},
 		{1234, "1,234"},
 		{100000, "100,000"},
+		{128000, "128,000"},
+		{200000, "200,000"},
 		{1000000, "1,000,000"},
+		{1048576, "1,048,576"},
 		{10000000, "10,000,000"},
 		{-1, "-1"},
 		{-1000, "-1,000"},
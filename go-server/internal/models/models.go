@@ -464,6 +464,21 @@ var Aliases = map[string]string{
 	"kuaishou/kat-coder-pro":  "kat-coder-pro",
 }
 
+// ByProvider indexes Models by lowercase provider name. The registry is
+// static, so the index is built once at package init and shared by every
+// provider-scoped lookup. Callers must treat the slices as read-only.
+var ByProvider = indexByProvider(Models)
+
+// indexByProvider groups models by lowercase provider name in a single pass.
+func indexByProvider(ms map[string]Model) map[string][]Model {
+	idx := make(map[string][]Model)
+	for _, m := range ms {
+		p := strings.ToLower(m.Provider)
+		idx[p] = append(idx[p], m)
+	}
+	return idx
+}
+
 // FormatInt formats an integer with comma separators.
 func FormatInt(n int) string {
 	if n < 0 {
@@ -113,21 +113,3 @@ func TestPricingSummary_SortedByInputPrice(t *testing.T) {
 		}
 	}
 }
-
-func TestFormatInt_Resources(t *testing.T) {
-	tests := []struct {
-		input int
-		want  string
-	}{
-		{0, "0"},
-		{999, "999"},
-		{1000, "1,000"},
-		{200000, "200,000"},
-	}
-	for _, tc := range tests {
-		got := models.FormatInt(tc.input)
-		if got != tc.want {
-			t.Errorf("FormatInt(%d) = %q, want %q", tc.input, got, tc.want)
-		}
-	}
-}
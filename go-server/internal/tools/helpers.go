@@ -268,23 +268,18 @@ var providerAliases = map[string]string{
 // Empty string means no filter for that field. Provider supports common aliases.
 func FilterModels(provider, status, capability string) []models.Model {
 	var results []models.Model
-	for _, m := range models.Models {
-		results = append(results, m)
-	}
-
 	if provider != "" {
 		p := strings.ToLower(provider)
 		// Resolve provider alias to canonical name
 		if canonical, ok := providerAliases[p]; ok {
 			p = canonical
 		}
-		var filtered []models.Model
-		for _, m := range results {
-			if strings.ToLower(m.Provider) == p {
-				filtered = append(filtered, m)
-			}
+		// Copy so callers can never mutate the shared index.
+		results = append(results, models.ByProvider[p]...)
+	} else {
+		for _, m := range models.Models {
+			results = append(results, m)
 		}
-		results = filtered
 	}
 
 	if status != "" {
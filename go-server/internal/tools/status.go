@@ -30,8 +30,8 @@ func CheckModelStatus(modelID string) string {
 	if m.Status == "legacy" || m.Status == "deprecated" {
 		// Find current replacements from the same provider
 		var replacements []models.Model
-		for _, r := range models.Models {
-			if r.Provider == m.Provider && r.Status == "current" {
+		for _, r := range models.ByProvider[strings.ToLower(m.Provider)] {
+			if r.Status == "current" {
 				replacements = append(replacements, r)
 			}
 		}